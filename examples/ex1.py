@@ -24,15 +24,16 @@ action_sets = {
     4: [3, 4, 5]
 }
 
-scenario = Scenario(G, action_sets, target_values)
+if __name__ == "__main__":
+    scenario = Scenario(G, action_sets, target_values)
 
-dist_greedy = distributed_greedy(scenario)
-gen_dist_greedy = greedy_with_information_sharing_rule(scenario, generalized_distributed_greedy_rule)
-high_marginal = greedy_with_information_sharing_rule(scenario, highest_marginal_contribution_rule)
+    dist_greedy = distributed_greedy(scenario)
+    gen_dist_greedy = greedy_with_information_sharing_rule(scenario, generalized_distributed_greedy_rule)
+    high_marginal = greedy_with_information_sharing_rule(scenario, highest_marginal_contribution_rule)
 
-visualize_assignment_comparison(
-    scenario, 
-    [dist_greedy, gen_dist_greedy, high_marginal], 
-    assignment_titles=["Distributed Greedy", "Generalized Distributed Greedy (Self Sharing)", "Highest Marginal Contribution Sharing"],
-    figure_directory="out"
-)
\ No newline at end of file
+    visualize_assignment_comparison(
+        scenario, 
+        [dist_greedy, gen_dist_greedy, high_marginal], 
+        assignment_titles=["Distributed Greedy", "Generalized Distributed Greedy (Self Sharing)", "Highest Marginal Contribution Sharing"],
+        figure_directory="out"
+    )
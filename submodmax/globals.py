@@ -1,2 +1,3 @@
 DEFAULT_OUT_DIR = "out"
-DEFAULT_ARC = 0.3
\ No newline at end of file
+DEFAULT_ARC = 0.3
+DEFAULT_DPI = 80
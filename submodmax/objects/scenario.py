@@ -45,6 +45,18 @@ class Scenario:
     def assign_number(self, nbr: int):
         self.nbr = nbr
 
+    def get_signature(self) -> tuple:
+        """
+        Returns a hashable summary of the scenario's content (its graph edges, action sets, and target values). Scenarios
+        with equal signatures are the same problem, regardless of their number.
+        """
+        return (
+            tuple(sorted(self.G.edges())),
+            tuple((agent, tuple(action_set)) for agent, action_set in sorted(self.action_sets.items())),
+            tuple(sorted(self.target_values.items()))
+        )
+
+    def get_graph(self) -> nx.DiGraph: return self.G
     def get_graph_copy(self) -> nx.DiGraph: return self.G.copy()
     def get_action_set(self) -> dict[int, list[int]]: return self.action_sets
     def get_target_values(self) -> dict[int, int]: return self.target_values
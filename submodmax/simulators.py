@@ -5,7 +5,7 @@ from collections import defaultdict
 from typing import Callable, Any, Dict
 from submodmax.objects.scenario import Scenario
 from submodmax.objects.assignment import Assignment
-from submodmax.visualize import visualize_best_worst_scenarios
+from submodmax.visualize import visualize_best_worst_scenario_batch, render_concurrently
 from submodmax.globals import DEFAULT_OUT_DIR
 
 def algorithms_versus_scenarios(
@@ -18,7 +18,26 @@ def algorithms_versus_scenarios(
     runs_per_scenario: int = 1000,
     create_visuals: bool = False,
     out_directory: str = DEFAULT_OUT_DIR,
+    parallel: bool = True,
 ):
+    """
+    Runs every algorithm on `runs_per_scenario` scenarios of each type, and writes statistics on the resulting solution
+    values and efficiencies to `out_directory`. With `create_visuals` set, also saves a figure of the five best and five
+    worst scenarios for each algorithm and scenario type.
+
+    Args:
+        scenario_builders (list[Callable[..., Scenario]]): A builder for each scenario type.
+        scenario_builder_params (list[list[Any]]): The arguments passed to each scenario builder.
+        scenario_type_titles (list[str]): A title for each scenario type.
+        algorithms (list[Callable[..., Assignment]]): The algorithms to be compared.
+        algorithm_params (list[list[Any]]): The extra arguments passed to each algorithm after the scenario.
+        algorithm_titles (list[str]): A title for each algorithm.
+        runs_per_scenario (int): The number of scenarios built of each type. Figures need at least 10.
+        create_visuals (bool): Whether to save figures of the best and worst scenarios.
+        out_directory (str): The directory where the statistics and figures are saved.
+        parallel (bool): Whether to render the figures in parallel worker processes. On platforms that spawn worker
+            processes (macOS, Windows), the calling script then needs an `if __name__ == "__main__":` guard.
+    """
     os.makedirs(out_directory, exist_ok=True)
 
     # Data accumulators
@@ -66,6 +85,7 @@ def algorithms_versus_scenarios(
 
     # --- CREATE VISUALIZATIONS (sorted by efficiency) ---
     if create_visuals and runs_per_scenario >= 10:
+        jobs = []
         for stype in scenario_type_titles:
             for alg in algorithm_titles:
                 data = stats[stype][alg]['assignments']
@@ -79,11 +99,12 @@ def algorithms_versus_scenarios(
                     # Best 5: highest to lower efficiency
                     best_5 = data_sorted[-5:][::-1]
 
-                    visualize_best_worst_scenarios(
+                    jobs.append(dict(
                         best=best_5,
                         worst=worst_5,
                         scenario_type=stype,
                         algorithm_title=alg,
                         output_dir=out_directory
-                    )
+                    ))
+        render_concurrently(visualize_best_worst_scenario_batch, jobs, parallel=parallel, batched=True)
     return stats 
\ No newline at end of file
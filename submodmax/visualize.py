@@ -1,12 +1,441 @@
 import os
+import pickle
+import numbers
+import shutil
+import hashlib
+import functools
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Any
+import matplotlib
+
+# Figures are only ever saved to disk, so default to the non-interactive Agg backend.
+# Set SUBMODMAX_MPL_BACKEND to another backend (or to an empty string to keep matplotlib's default) when working interactively.
+_backend = os.environ.get("SUBMODMAX_MPL_BACKEND", "Agg")
+if _backend:
+    matplotlib.use(_backend)
+matplotlib.rcParams["figure.max_open_warning"] = 0
+matplotlib.rcParams["path.simplify"] = True
+matplotlib.rcParams["path.simplify_threshold"] = 1.0
+matplotlib.rcParams["agg.path.chunksize"] = 10000
+
 import matplotlib.pyplot as plt
-import networkx as nx
-import tabulate
+import numpy as np
+from dataclasses import dataclass
+from matplotlib.collections import Collection, LineCollection, PathCollection, PolyCollection
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.path import Path
+from matplotlib.transforms import IdentityTransform
+from PIL import Image
 from submodmax.objects.scenario import Scenario
 from submodmax.objects.assignment import Assignment
 from submodmax.utils.scenario_utils import get_best_scenarios, get_worst_scenarios
 from submodmax.utils.assignment_utils import score_assignment
-from submodmax.globals import DEFAULT_OUT_DIR, DEFAULT_ARC
+from submodmax.globals import DEFAULT_OUT_DIR, DEFAULT_ARC, DEFAULT_DPI
+
+# The '->' head as (distance back from the tip, distance across the edge) pairs, in points
+ARROW_HEAD_TEMPLATE = np.array([[4.0, 2.0], [0.0, 0.0], [4.0, -2.0]])
+EDGE_WIDTH = 1.0
+# Favor encoding speed over file size when writing figures
+PIL_SAVE_KWARGS = {
+    "png": {"compress_level": 1, "optimize": False},
+    "jpg": {"quality": 80},
+}
+RENDER_CACHE_DIR = ".cache" # created inside the figure directory
+RENDER_CACHE_VERSION = 2 # bump whenever a change to this module alters how figures look
+MIN_PARALLEL_RENDERS = 4 # below this, starting worker processes costs more than it saves
+SUBPLOT_SIDES = ("left", "right", "bottom", "top", "wspace", "hspace")
+SUBSCRIPT_DIGITS = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
+
+@functools.lru_cache(maxsize=None)
+def _target_identifier(target: int, use_mathtext: bool = False) -> str:
+    """
+    Returns the 't_i' label drawn under a target. Unless `use_mathtext` is set, it is written with Unicode subscripts so
+    it skips the MathText parser.
+    """
+    if use_mathtext:
+        return rf"$t_{{{target}}}$"
+    return "t" + str(target).translate(SUBSCRIPT_DIGITS)
+
+def _arc_control_points(tails: np.ndarray, heads: np.ndarray, rad: float) -> np.ndarray:
+    """
+    Returns the quadratic Bézier control points that bend each edge the same way matplotlib's 'arc3' connection style does.
+    """
+    deltas = heads - tails
+    return (tails + heads) / 2 + rad * np.column_stack([deltas[:, 1], -deltas[:, 0]])
+
+class _ShaftCollection(PathCollection):
+    """
+    A single artist for the shafts of a group of edges, rebuilt in display space each time it is drawn. That lets arced
+    shafts bend the way matplotlib's 'arc3' connection style does, and lets shafts stop `margin` points short of both of
+    their nodes.
+    """
+    def __init__(self, tails: np.ndarray, heads: np.ndarray, rad: float = 0.0, margin: float = 0.0, **kwargs):
+        super().__init__([], facecolors="none", transform=IdentityTransform(), **kwargs)
+        self._tails = tails
+        self._heads = heads
+        self._rad = rad
+        self._margin = margin
+
+    def draw(self, renderer):
+        tails = self.axes.transData.transform(self._tails)
+        heads = self.axes.transData.transform(self._heads)
+        controls = _arc_control_points(tails, heads, self._rad)
+        if self._margin:
+            margin = renderer.points_to_pixels(self._margin)
+            starts, ends = controls - tails, heads - controls
+            tails = tails + margin * starts / np.hypot(starts[:, 0], starts[:, 1])[:, None]
+            heads = heads - margin * ends / np.hypot(ends[:, 0], ends[:, 1])[:, None]
+        codes = [Path.MOVETO, Path.CURVE3, Path.CURVE3] if self._rad else [Path.MOVETO, Path.LINETO, Path.LINETO]
+        self.set_paths([Path([t, c, h], codes) for t, c, h in zip(tails, controls, heads)])
+        super().draw(renderer)
+
+class _ArrowheadCollection(PolyCollection):
+    """
+    A single artist for the '->' style heads of a group of edges. Each head sits on the edge of its target node, which
+    depends on the node's size in points, so the heads are placed in display space each time the collection is drawn.
+    """
+    def __init__(self, tails: np.ndarray, heads: np.ndarray, rad: float, node_size: float, **kwargs):
+        super().__init__([], closed=False, facecolors="none", transform=IdentityTransform(), **kwargs)
+        self._tails = tails
+        self._heads = heads
+        self._rad = rad
+        self._node_size = node_size
+
+    def draw(self, renderer):
+        tails = self.axes.transData.transform(self._tails)
+        heads = self.axes.transData.transform(self._heads)
+        if self._rad:
+            tails = _arc_control_points(tails, heads, self._rad)
+        margin = renderer.points_to_pixels(np.sqrt(self._node_size) / 2)
+        template = renderer.points_to_pixels(ARROW_HEAD_TEMPLATE)
+
+        # Heads that would not clear both nodes are left off
+        directions = heads - tails
+        lengths = np.hypot(directions[:, 0], directions[:, 1])
+        visible = lengths > 2 * margin + template[0, 0]
+        directions = directions[visible] / lengths[visible, None]
+        normals = np.column_stack([-directions[:, 1], directions[:, 0]])
+        tips = heads[visible] - margin * directions
+
+        # Rotate the template from (along, across) edge coordinates onto each edge
+        verts = (
+            tips[:, None, :]
+            - template[None, :, 0, None] * directions[:, None, :]
+            + template[None, :, 1, None] * normals[:, None, :]
+        )
+        self.set_verts(verts, closed=False)
+        super().draw(renderer)
+
+def _draw_arrows(
+        ax: plt.Axes,
+        edges: np.ndarray,
+        coords: np.ndarray,
+        color: str,
+        node_size: float,
+        rad: float = 0.0,
+        overlay: bool = False
+) -> list[Collection]:
+    """
+    Draws a group of directed edges onto `ax` using one artist for the shafts and one for the heads, and returns them.
+    `edges` is an (E, 2) array of node ids and `coords` holds the position of node `n` in row `n`.
+
+    Shafts normally run between node centers underneath the nodes. With `overlay` set they stop at the node edges
+    instead, so they can be drawn on top of an already rendered figure, whose data limits are then left alone.
+    """
+    if len(edges) == 0:
+        return []
+    tails = coords[edges[:, 0]]
+    heads = coords[edges[:, 1]]
+    if rad or overlay:
+        margin = np.sqrt(node_size) / 2 if overlay else 0.0
+        shafts = _ShaftCollection(tails, heads, rad, margin, edgecolors=color, linewidths=EDGE_WIDTH, zorder=1)
+    else:
+        shafts = LineCollection(np.stack([tails, heads], axis=1), colors=color, linewidths=EDGE_WIDTH, zorder=1)
+    ax.add_collection(shafts, autolim=False)
+    arrowheads = _ArrowheadCollection(tails, heads, rad, node_size, edgecolors=color, linewidths=EDGE_WIDTH, zorder=1)
+    ax.add_collection(arrowheads, autolim=False)
+
+    if not overlay:
+        # Pad the data limits around the edges the same way networkx does
+        corners = np.concatenate([tails, heads])
+        low, high = corners.min(axis=0), corners.max(axis=0)
+        padding = 0.05 * (high - low)
+        ax.update_datalim([low - padding, high + padding])
+        ax.autoscale_view()
+    return [shafts, arrowheads]
+
+def _image_format(save_path: str) -> str:
+    """
+    Returns the image format implied by the extension of `save_path`, with 'jpeg' written as 'jpg'.
+    """
+    image_format = os.path.splitext(save_path)[1].lstrip(".").lower()
+    return "jpg" if image_format == "jpeg" else image_format
+
+def _save_figure(fig: plt.Figure, save_path: str, dpi: int, transparent: bool = False) -> None:
+    """
+    Saves `fig` to `save_path`, picking the encoder settings from the file extension ('png' or 'jpg').
+    """
+    image_format = _image_format(save_path)
+    fig.savefig(save_path, dpi=dpi, transparent=transparent, pil_kwargs=PIL_SAVE_KWARGS.get(image_format))
+
+def render_concurrently(
+        render: Callable[..., Any],
+        jobs: list[dict[str, Any]],
+        parallel: bool = True,
+        batched: bool = False
+) -> None:
+    """
+    Calls `render(**job)` for every job, or, if `batched` is set, `render(batch)` once per worker with that worker's share
+    of the jobs. When `parallel` is set and there are enough jobs, they are spread over worker processes, so every job
+    must be picklable and `render` should save its figures rather than return them. On platforms that spawn worker
+    processes, the calling script needs an `if __name__ == "__main__":` guard.
+    """
+    workers = 1
+    if parallel and len(jobs) >= MIN_PARALLEL_RENDERS:
+        workers = min(len(jobs), os.cpu_count() or 1)
+    if batched:
+        calls = [((jobs[worker::workers],), {}) for worker in range(workers)]
+    else:
+        calls = [((), job) for job in jobs]
+
+    if workers == 1:
+        for args, kwargs in calls:
+            render(*args, **kwargs)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(render, *args, **kwargs) for args, kwargs in calls]
+        for future in futures:
+            future.result()
+
+def _render_cache_key(scenario: Scenario, assignment: Assignment, *style: Any) -> str:
+    """
+    Returns a content hash of everything that determines how a saved `visualize_scenario` figure looks.
+    """
+    pairs = tuple(assignment.get_assignment_pairs()) if assignment else None
+    content = (RENDER_CACHE_VERSION, matplotlib.__version__, scenario.get_signature(), pairs, style)
+    return hashlib.blake2b(pickle.dumps(content), digest_size=16).hexdigest()
+
+def _figure_path(figure_directory: str, title: str, image_format: str) -> str:
+    """
+    Returns where a figure titled `title` is saved, creating `figure_directory` if needed.
+    """
+    os.makedirs(figure_directory, exist_ok=True)
+    return os.path.join(figure_directory, f"{title.replace(' ','')}.{image_format}")
+
+def _cache_path(save_path: str, key: str) -> str:
+    """
+    Returns where the figure saved to `save_path` is cached under the render cache `key`.
+    """
+    directory, file_name = os.path.split(save_path)
+    return os.path.join(directory, RENDER_CACHE_DIR, key + os.path.splitext(file_name)[1])
+
+def _restore_from_cache(cache_path: str, save_path: str) -> bool:
+    """
+    Copies a cached figure to `save_path`, returning whether there was one.
+    """
+    if not os.path.exists(cache_path):
+        return False
+    shutil.copyfile(cache_path, save_path)
+    return True
+
+def _store_in_cache(save_path: str, cache_path: str) -> None:
+    """
+    Copies a freshly saved figure into the render cache. The copy is moved into place in one step, so concurrent renders
+    never see a partially written cache entry.
+    """
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    shutil.copyfile(save_path, temp_path)
+    os.replace(temp_path, cache_path)
+
+def _write_image(pixels: np.ndarray, save_path: str, dpi: int) -> None:
+    """
+    Encodes an RGBA pixel buffer and writes it to `save_path`, with the same encoder settings as `_save_figure`.
+    """
+    image_format = _image_format(save_path)
+    image = Image.fromarray(pixels)
+    if image_format == "jpg":
+        # Blend any transparency onto white, as `savefig` does for JPEGs
+        background = Image.new("RGB", image.size, "white")
+        background.paste(image, mask=image)
+        image = background
+    image.save(save_path, dpi=(dpi, dpi), **PIL_SAVE_KWARGS.get(image_format, {}))
+
+@dataclass(frozen=True, eq=False)
+class ScenarioLayout:
+    """
+    The parts of a scenario's visualization that do not depend on the assignment being shown or on styling, so they can be
+    computed once and shared by every render of the same scenario. Target nodes are drawn as pseudo nodes numbered after
+    the agents; they only exist in `pos`, never in the scenario's graph. Edges are (E, 2) arrays of node ids and `coords`
+    holds the position of node `n` in row `n`, while `xy_agents` and `xy_targets` are the rows of each kind of node.
+    """
+    agent_count: int
+    pos: dict[int, tuple[float, float]]
+    coords: np.ndarray
+    xy_agents: np.ndarray
+    xy_targets: np.ndarray
+    pseudo_targets: dict[int, int]
+    straight_edges: np.ndarray
+    curved_edges: np.ndarray
+    action_set_edges: np.ndarray
+    agent_labels: dict[int, int]
+    target_labels: dict[int, int]
+    node_size: float
+    rad: float
+
+@functools.lru_cache(maxsize=32)
+def _build_layout(scenario: Scenario, arc_rads_scale: float = DEFAULT_ARC) -> ScenarioLayout:
+    """
+    Computes the `ScenarioLayout` of a `scenario`. Scenarios hash by identity, so repeated renders of the same scenario
+    object reuse the cached layout.
+    """
+    G = scenario.get_graph()
+    action_sets = scenario.get_action_set()
+    target_values = scenario.get_target_values()
+
+    # Agent positioning
+    agent_count = len(G)
+    target_count = len(target_values)
+    node_size = 500 * (5 / agent_count)
+    rad = arc_rads_scale * (agent_count / 5)
+    pseudo_targets = {target: agent_count + target for target in range(1, target_count + 1)}
+    agents = range(1, agent_count + 1)
+    tops = np.stack([np.arange(agent_count), np.full(agent_count, 0.1)], axis=1)
+    bottoms_x = np.arange(target_count) + (tops[:, 0].mean() - (target_count - 1) / 2)
+    bottoms = np.stack([bottoms_x, np.full(target_count, -0.2)], axis=1)
+    pos = dict(zip(agents, map(tuple, tops.tolist())))
+    pos.update(zip(pseudo_targets.values(), map(tuple, bottoms.tolist())))
+    coords = np.concatenate([np.full((1, 2), np.nan), tops, bottoms])
+
+    # Edges between adjacent agents are drawn straight, all others are arced
+    edges = np.fromiter((node for edge in G.edges() for node in edge), dtype=np.int32).reshape(-1, 2)
+    distance = np.abs(edges[:, 0] - edges[:, 1])
+    straight_edges = edges[distance == 1]
+    curved_edges = edges[distance > 1]
+    action_set_edges = np.array(
+        [(u, v + agent_count) for u, action_set in action_sets.items() for v in action_set], dtype=np.int32
+    ).reshape(-1, 2)
+
+    # Default labels: agents by number, targets (keyed by their pseudo nodes) by value
+    agent_labels = {agent: agent for agent in agents}
+    target_labels = dict(zip(pseudo_targets.values(), target_values.values()))
+
+    return ScenarioLayout(
+        agent_count, pos, coords, tops, bottoms, pseudo_targets, straight_edges, curved_edges, action_set_edges, agent_labels,
+        target_labels, node_size, rad
+    )
+
+def _node_labels(
+        layout: ScenarioLayout,
+        agent_labels: dict[int, str],
+        target_labels: dict[int, str]
+) -> tuple[dict[int, str], dict[int, str]]:
+    """
+    Returns the agent and target labels to draw, keyed by node, falling back on the layout's default labels. Target labels
+    are given keyed by target and returned keyed by pseudo target.
+    """
+    if agent_labels is None:
+        agent_labels = layout.agent_labels
+    if target_labels is None:
+        target_labels = layout.target_labels
+    else:
+        target_labels = {layout.pseudo_targets[target]: target_labels[target] for target in target_labels}
+    return agent_labels, target_labels
+
+def _draw_node_labels(ax: plt.Axes, pos: dict[int, tuple[float, float]], labels: dict[int, str], font_size: int) -> None:
+    """
+    Writes each label in `labels` centered on its node, the same way `nx.draw_networkx_labels` does.
+    """
+    for node, label in labels.items():
+        x, y = pos[node]
+        ax.text(
+            x, y, str(label), size=font_size, color='k', family='sans-serif', weight='normal', horizontalalignment='center',
+            verticalalignment='center', transform=ax.transData, clip_on=True
+        )
+
+def _title_footprint(ax: plt.Axes) -> tuple[int, int]:
+    """
+    Returns the parts of the size of `ax`'s title, in pixels, that a tight layout of its figure depends on: its height,
+    and how much wider it is than `ax`.
+    """
+    extent = ax.title.get_window_extent(ax.figure.canvas.get_renderer())
+    return round(extent.height), max(0, round(extent.width - ax.bbox.width))
+
+def _draw_scenario_background(
+        ax: plt.Axes,
+        layout: ScenarioLayout,
+        agent_labels: dict[int, str],
+        target_labels: dict[int, str],
+        agent_label_size: int,
+        target_label_size: int,
+        text_color: str,
+        normal_edge_color: str,
+        use_mathtext: bool
+) -> None:
+    """
+    Draws everything in a scenario's visualization that does not depend on the assignment being shown: the agent graph,
+    the targets and action sets, and their labels. Target labels are keyed by pseudo target.
+    """
+    pos = layout.pos
+    node_size = layout.node_size
+
+    # Draw agent graph
+    ax.scatter(layout.xy_agents[:, 0], layout.xy_agents[:, 1], s=node_size, c='lightblue', zorder=2)
+    _draw_arrows(ax, layout.straight_edges, layout.coords, normal_edge_color, node_size)
+    _draw_arrows(ax, layout.curved_edges, layout.coords, normal_edge_color, node_size, rad=-layout.rad)
+
+    # Draw targets and action sets
+    ax.scatter(layout.xy_targets[:, 0], layout.xy_targets[:, 1], s=node_size, c='gold', zorder=2)
+    _draw_arrows(ax, layout.action_set_edges, layout.coords, normal_edge_color, node_size)
+
+    # Agent and target labeling
+    _draw_node_labels(ax, pos, agent_labels, agent_label_size)
+    _draw_node_labels(ax, pos, target_labels, target_label_size)
+    
+    # Target identification
+    for real_target, pseudo_target in layout.pseudo_targets.items():
+        x, y = pos[pseudo_target]
+        ax.text(x, y - 0.08, _target_identifier(real_target, use_mathtext), fontsize=10, ha='center', va='top', color=text_color)
+
+    ax.set_ylim(-0.6, 0.4)
+    ax.axis('off')
+
+def _draw_assignment(
+        ax: plt.Axes,
+        layout: ScenarioLayout,
+        assignment: Assignment,
+        color: str,
+        overlay: bool = False
+) -> list[Collection]:
+    """
+    Draws the edges from each agent to the target it chose in `assignment` (if any), and returns the artists drawn.
+    See `_draw_arrows` for `overlay`.
+    """
+    if not assignment:
+        return []
+    assignment_edges = np.array(
+        [(agent, layout.pseudo_targets[target]) for agent, target in assignment.get_assignment_pairs() if target], dtype=np.int32
+    ).reshape(-1, 2)
+    return _draw_arrows(ax, assignment_edges, layout.coords, color, layout.node_size, overlay=overlay)
+
+def _scenario_title(
+        title: str,
+        assignment: Assignment,
+        metric: str,
+        metric_value: str | int | float,
+        show_metric_value: bool,
+        use_mathtext: bool
+) -> str:
+    """
+    Returns `title` with the assignment's metric value appended (when there is an assignment and it should be shown).
+    """
+    if not (assignment and show_metric_value):
+        return title
+    if metric == "score":
+        return rf"{title} - $f(x) = {metric_value}$" if use_mathtext else f"{title} - f(x) = {metric_value}"
+    if metric == "efficiency":
+        return rf"{title} - $\gamma(x) = {metric_value}$" if use_mathtext else f"{title} - γ(x) = {metric_value}"
+    return title
 
 def visualize_scenario(
         scenario: Scenario,
@@ -26,7 +455,12 @@ def visualize_scenario(
         ax: plt.Axes = None,
         arc_rads_scale: float = DEFAULT_ARC,
         transparent: bool = False,
-        figure_directory: str = None
+        figure_directory: str = None,
+        layout: ScenarioLayout = None,
+        dpi: int = DEFAULT_DPI,
+        image_format: str = "png",
+        use_cache: bool = True,
+        use_mathtext: bool = False
 ) -> None:
     """
     A function that visualizes a given `scenario` (and optionally an `assignment` of agents to targets within the context of that `scenario`).
@@ -41,92 +475,200 @@ def visualize_scenario(
         arc_rads_scale (float): A scalar factor that determines how much the edges between non-adjacent
             agents should be arced.
         figure_directory (str): The directory where the figure should be saved. If None, the figure will not be saved.
+        layout (ScenarioLayout): A precomputed layout of `scenario`. If given, `arc_rads_scale` is ignored.
+        dpi (int): The resolution the figure is saved at.
+        image_format (str): The image format the figure is saved as ('png' or the lossy but smaller 'jpg').
+        use_cache (bool): Whether to reuse an identical figure saved earlier instead of rendering it again. Only figures
+            created by this function (`ax` is None) are cached, under `figure_directory`/.cache.
+        use_mathtext (bool): Whether to typeset the metric and target identifiers with MathText instead of plain Unicode.
     """
 
-    G = scenario.get_graph_copy()
-    action_sets = scenario.get_action_set()
-    target_values = scenario.get_target_values()
-
-    if ax is None:
-        fig, ax = plt.subplots(figsize=(6, 4))
-    
-    # Agent positioning
-    agent_count = len(G)
-    target_count = len(target_values)
-    node_size = 500 * (5 / agent_count)
-    rad = arc_rads_scale * (agent_count / 5)
-    pseudo_targets = {target: agent_count + target for target in range(1, target_count + 1)}
-    G.add_nodes_from(pseudo_targets.values())
-    pos_top = {agent: (agent - 1, 0.1) for agent in range(1, agent_count + 1)}
-    pos_bottom = {pseudo_targets[i]: (i - 1, -0.2) for i in range(1, target_count + 1)}
-    x_coords_top = [pos_top[agent][0] for agent in pos_top]
-    center_x_top = sum(x_coords_top) / len(x_coords_top)
-    shift_x = center_x_top - (len(pos_bottom) - 1) / 2 
-    pos_bottom_centered = {target: (pos_bottom[target][0] + shift_x, pos_bottom[target][1]) for target in pos_bottom}
-    pos = {**pos_top, **pos_bottom_centered} 
-
-    # Draw agent graph
-    nx.draw_networkx_nodes(G, pos, nodelist=range(1, agent_count + 1), ax=ax, node_color='lightblue', node_size=node_size)
-    straight_edges = [(u, v) for u, v in G.edges() if abs(u - v) == 1]
-    curved_edges = [(u, v) for u, v in G.edges() if abs(u - v) > 1]
-    nx.draw_networkx_edges(G, pos, edgelist=straight_edges, ax=ax, edge_color=normal_edge_color, arrows=True, arrowstyle='->', node_size=node_size)
-    nx.draw_networkx_edges(G, pos, edgelist=curved_edges, ax=ax, connectionstyle=f'arc3,rad={-rad}', edge_color=normal_edge_color, arrows=True, arrowstyle='->', node_size=node_size)
+    if layout is None:
+        layout = _build_layout(scenario, arc_rads_scale)
 
-    # Draw targets and action sets
-    nx.draw_networkx_nodes(G, pos, nodelist=pseudo_targets.values(), ax=ax, node_color='gold', node_size=node_size)
-    action_set_edges = [(u, v + agent_count) for u, action_set in action_sets.items() for v in action_set]
-    nx.draw_networkx_edges(G, pos, edgelist=action_set_edges, ax=ax, edge_color=normal_edge_color, arrows=True, arrowstyle='->', node_size=node_size)
-
-    # Draw in assignment (if applicable)
-    if assignment:
-        assignment_edges = []
-        for agent, target in assignment.get_assignment_pairs():
-            if target:
-                assignment_edges.append((agent, pseudo_targets[target]))
-        nx.draw_networkx_edges(G, pos, edgelist=assignment_edges, ax=ax, edge_color=highlight_edge_color, arrows=True, arrowstyle='->', node_size=node_size)
+    save_path = None
+    cache_path = None
+    if figure_directory:
+        save_path = _figure_path(figure_directory, title, image_format)
+        if use_cache and ax is None:
+            cache_path = _cache_path(save_path, _render_cache_key(
+                scenario, assignment, "figure", title, metric, metric_value, show_metric_value, agent_labels,
+                target_labels, agent_label_size, target_label_size, text_color, normal_edge_color, highlight_edge_color,
+                show_title, layout.rad, transparent, dpi, use_mathtext
+            ))
+            if _restore_from_cache(cache_path, save_path):
+                return
 
-    # Agent and target labeling
-    if agent_labels is None:
-        agent_labels = {agent : agent for agent in range(1, agent_count + 1)}
-    if target_labels is None:
-        target_labels = dict(zip(pseudo_targets.values(), target_values.values()))
+    created_figure = ax is None
+    if created_figure:
+        fig, ax = plt.subplots(figsize=(6, 4))
     else:
-        target_labels = {pseudo_targets[target]: target_labels[target] for target in target_labels}
-    nx.draw_networkx_labels(G, pos, ax=ax, labels=agent_labels, font_size=agent_label_size)
-    nx.draw_networkx_labels(G, pos, ax=ax, labels=target_labels, font_size=target_label_size)
-    
-    # Target identification
-    for real_target, pseudo_target in pseudo_targets.items():
-        x, y = pos[pseudo_target]
-        ax.text(x, y - 0.08, rf"$t_{{{real_target}}}$", fontsize=10, ha='center', va='top', color=text_color)
+        fig = ax.figure
 
-    # Customize title
+    agent_labels, target_labels = _node_labels(layout, agent_labels, target_labels)
+    _draw_scenario_background(
+        ax, layout, agent_labels, target_labels, agent_label_size, target_label_size, text_color,
+        normal_edge_color, use_mathtext
+    )
+    _draw_assignment(ax, layout, assignment, highlight_edge_color)
     if show_title:
-        mod_title = title
-        if assignment and show_metric_value:
-            if metric == "score":
-                mod_title = rf"{title} - $f(x) = {metric_value}$"
-            if metric == "efficiency":
-                mod_title = rf"{title} - $\gamma(x) = {metric_value}$"
-            
+        mod_title = _scenario_title(title, assignment, metric, metric_value, show_metric_value, use_mathtext)
         ax.set_title(mod_title, pad=20, color=text_color)
-    
-    ax.set_ylim(-0.6, 0.4)
-    ax.axis('off')
-    plt.tight_layout()
+    if created_figure:
+        # Figures passed in through `ax` are laid out by whoever created them
+        fig.tight_layout()
 
     if figure_directory:
-        os.makedirs(figure_directory, exist_ok=True)
-        save_path = os.path.join(figure_directory, f"{title.replace(' ','')}.png")
-        plt.savefig(save_path, transparent=transparent)
+        _save_figure(fig, save_path, dpi, transparent=transparent)
         #print(f"Visualization saved to [{save_path}]")
-        plt.close()
+        if cache_path:
+            _store_in_cache(save_path, cache_path)
+        plt.close(fig)
+
+def _render_over_background(
+        ax: plt.Axes,
+        background: tuple[tuple, Any] | None,
+        scenario: Scenario,
+        figure_directory: str,
+        title: str = "Visual",
+        assignment: Assignment = None,
+        metric: str = "score",
+        metric_value: str | int | float = None,
+        show_metric_value: bool = True,
+        agent_labels: dict[int, str] = None,
+        target_labels: dict[int, str] = None,
+        agent_label_size: int = 12,
+        target_label_size: int = 12,
+        text_color: str = "black",
+        normal_edge_color: str = "gray",
+        highlight_edge_color: str = "red",
+        show_title: bool = True,
+        arc_rads_scale: float = DEFAULT_ARC,
+        transparent: bool = False,
+        layout: ScenarioLayout = None,
+        dpi: int = DEFAULT_DPI,
+        image_format: str = "png",
+        use_cache: bool = True,
+        use_mathtext: bool = False
+) -> tuple[tuple, Any] | None:
+    """
+    Saves the figure `visualize_scenario` would for the same arguments, drawn on `ax`, a 6x4 axes reused for a series of
+    renders. Renders of one scenario only differ in their assignment and title, so everything else is drawn once, kept as
+    pixels in `background`, and restored for each render with just the assignment and title drawn over it. Returns the
+    background to pass to the next render.
+
+    Assignment shafts drawn this way stop at the node edges, so these figures are cached apart from those of
+    `visualize_scenario`.
+    """
+    if layout is None:
+        layout = _build_layout(scenario, arc_rads_scale)
+
+    save_path = _figure_path(figure_directory, title, image_format)
+    cache_path = None
+    if use_cache:
+        cache_path = _cache_path(save_path, _render_cache_key(
+            scenario, assignment, "blit", title, metric, metric_value, show_metric_value, agent_labels, target_labels,
+            agent_label_size, target_label_size, text_color, normal_edge_color, highlight_edge_color, show_title,
+            layout.rad, transparent, dpi, use_mathtext
+        ))
+        if _restore_from_cache(cache_path, save_path):
+            return background
+
+    fig = ax.figure
+    agent_labels, target_labels = _node_labels(layout, agent_labels, target_labels)
+    mod_title = _scenario_title(title, assignment, metric, metric_value, show_metric_value, use_mathtext) if show_title else ""
+
+    # The layout depends on the title's size, so titles of a different size get their own background
+    fig.set_dpi(dpi)
+    ax.set_title(mod_title, pad=20, color=text_color)
+    background_key = (
+        layout, agent_labels, target_labels, agent_label_size, target_label_size, text_color, normal_edge_color,
+        use_mathtext, transparent, dpi, _title_footprint(ax)
+    )
+    if background is None or background[0] != background_key:
+        ax.cla()
+        fig.set_dpi(matplotlib.rcParams["figure.dpi"])
+        fig.patch.set_facecolor("none" if transparent else matplotlib.rcParams["figure.facecolor"])
+        if transparent:
+            ax.patch.set_facecolor("none")
+        _draw_scenario_background(
+            ax, layout, agent_labels, target_labels, agent_label_size, target_label_size, text_color,
+            normal_edge_color, use_mathtext
+        )
+        # Lay out around the title from the default subplot parameters, as a new figure would, then leave the title
+        # out of the pixels
+        ax.set_title(mod_title, pad=20, color=text_color)
+        fig.subplots_adjust(**{side: matplotlib.rcParams[f"figure.subplot.{side}"] for side in SUBPLOT_SIDES})
+        fig.tight_layout()
+        # Lay out at the figure's usual dpi and render at the saved one, as `savefig` would
+        fig.set_dpi(dpi)
+        background_key = background_key[:-1] + (_title_footprint(ax),)
+        ax.title.set_text("")
+        fig.canvas.draw()
+        background = (background_key, fig.canvas.copy_from_bbox(fig.bbox))
+
+    fig.canvas.restore_region(background[1])
+    for artist in _draw_assignment(ax, layout, assignment, highlight_edge_color, overlay=True):
+        ax.draw_artist(artist)
+        artist.remove()
+    ax.set_title(mod_title, pad=20, color=text_color)
+    ax.draw_artist(ax.title)
+    ax.title.set_text("")
+
+    _write_image(np.asarray(fig.canvas.buffer_rgba()).copy(), save_path, dpi)
+    if cache_path:
+        _store_in_cache(save_path, cache_path)
+    return background
+
+def _format_table(data: list[list[Any]], headers: list[str]) -> str:
+    """
+    Formats `data` as a plain text table with a dashed rule under the `headers`, like tabulate's "simple" format. Numeric
+    columns are right aligned, with floats written in 'g' format and lined up on their decimal points. Everything else is
+    left aligned.
+    """
+    columns = []
+    right_aligned = []
+    for header, *cells in zip(headers, *data):
+        numeric = all(isinstance(cell, numbers.Number) for cell in cells)
+        if numeric and not all(isinstance(cell, numbers.Integral) for cell in cells):
+            cells = [format(float(cell), "g") for cell in cells]
+            # Line up on the decimal point, or on the exponent of numbers without one
+            points = [cell.rfind(".") if "." in cell else cell.lower().rfind("e") for cell in cells]
+            decimals = [len(cell) - point - 1 if point >= 0 else -1 for cell, point in zip(cells, points)]
+            cells = [cell + " " * (max(decimals) - places) for cell, places in zip(cells, decimals)]
+        columns.append([header] + [str(cell) for cell in cells])
+        right_aligned.append(numeric)
+    widths = [max([len(column[0]) + 2] + [len(cell) for cell in column[1:]]) for column in columns]
+
+    def format_row(row: list[str]) -> str:
+        cells = [f"{cell:>{width}}" if right else f"{cell:<{width}}" for cell, width, right in zip(row, widths, right_aligned)]
+        return "  ".join(cells).rstrip()
+
+    lines = [format_row([column[0] for column in columns]), "  ".join("-" * width for width in widths)]
+    lines.extend(format_row(list(row)) for row in zip(*(column[1:] for column in columns)))
+    return "\n".join(lines)
+
+def _render_on_shared_figure(jobs: list[dict[str, Any]]) -> None:
+    """
+    Saves a series of `visualize_scenario` renders using one figure, rather than setting up a new figure for each. Renders
+    of the same scenario share one drawing of it and only draw their assignments and titles over it.
+    """
+    fig, ax = plt.subplots(figsize=(6, 4))
+    # Blitting needs an Agg canvas, whatever the pyplot backend is
+    FigureCanvasAgg(fig)
+    background = None
+    try:
+        for job in jobs:
+            background = _render_over_background(ax, background, **job)
+    finally:
+        plt.close(fig)
 
 def visualize_assignment_comparison(
         scenario: Scenario,
         assignment_list: list[Assignment],
         assignment_titles: list[str] = None,
-        figure_directory: str = None
+        figure_directory: str = None,
+        parallel: bool = True
 ) -> None:
     """
     A function for visualizing the comparison of different assignments on a given `scenario`.
@@ -134,11 +676,14 @@ def visualize_assignment_comparison(
     Args:
         scenario (Scenario): The scenario the assignments are based on.
         assignment_list (list[Assignment]): A list of the agent to target assignments to be compared.
-        assignment_titles (list[str]): A list of titles to be associated with the assignments in the visuals.
+        assignment_titles (list[str]): A list of titles to be associated with the assignments in the visuals, one per
+            assignment. Defaults to numbering the assignments.
         figure_directory (str): The directory where the figures should be saved. If None, the figures will not be saved.
+        parallel (bool): Whether to render saved figures in parallel worker processes. On platforms that spawn worker
+            processes (macOS, Windows), the calling script then needs an `if __name__ == "__main__":` guard.
     """
 
-    G = scenario.get_graph_copy()
+    G = scenario.get_graph()
     target_values = scenario.get_target_values()
 
     # Compute optimal solution for comparison
@@ -150,17 +695,26 @@ def visualize_assignment_comparison(
     data = [["Optimal"] + [f"t{target}" for target in opt_assignment.get_choices()] + [opt_val] + [1.0]]
 
     if not assignment_titles:
-        assignment_titles = [f"Assignment #{i}" for i in range(1, len(assignment_list))]
+        assignment_titles = [f"Assignment #{i}" for i in range(1, len(assignment_list) + 1)]
+    elif len(assignment_titles) != len(assignment_list):
+        raise ValueError(f"Got {len(assignment_titles)} assignment titles for {len(assignment_list)} assignments")
 
-    visualize_scenario(scenario, title="Optimal", assignment=opt_assignment, metric_value=opt_val, figure_directory=figure_directory)
+    layout = _build_layout(scenario)
+    jobs = [dict(scenario=scenario, title="Optimal", assignment=opt_assignment, metric_value=opt_val, figure_directory=figure_directory, layout=layout)]
 
-    for index, assignment in enumerate(assignment_list):
+    for title, assignment in zip(assignment_titles, assignment_list):
         assignment_val = score_assignment(assignment, target_values)
-        visualize_scenario(scenario, title=assignment_titles[index], assignment=assignment, metric_value=assignment_val, figure_directory=figure_directory)
-        data.append([assignment_titles[index]] + [f"t{target}" for target in assignment.get_choices()] + [assignment_val] + [round(assignment_val / opt_val, 3)])
+        jobs.append(dict(scenario=scenario, title=title, assignment=assignment, metric_value=assignment_val, figure_directory=figure_directory, layout=layout))
+        data.append([title] + [f"t{target}" for target in assignment.get_choices()] + [assignment_val] + [round(assignment_val / opt_val, 3)])
+
+    if figure_directory:
+        render_concurrently(_render_on_shared_figure, jobs, parallel=parallel, batched=True)
+    else:
+        # Unsaved figures have to stay in this process, each on its own figure, to be of any use
+        render_concurrently(visualize_scenario, jobs, parallel=False)
 
     print("\nAssignment Comparison:\n")
-    print(tabulate.tabulate(data, headers=column_labels, tablefmt="simple"))
+    print(_format_table(data, column_labels))
     if figure_directory:
         print(f"\nVisualizations saved to {figure_directory}\n")
 
@@ -170,46 +724,60 @@ def visualize_best_worst_scenarios(
         scenario_type: str,
         algorithm_title: str,
         output_dir: str,
-        arc_rads_scale: float = DEFAULT_ARC
-) -> None:
+        arc_rads_scale: float = DEFAULT_ARC,
+        dpi: int = DEFAULT_DPI,
+        image_format: str = "png",
+        image_writer: Executor = None
+) -> Future | None:
     """
     A visualization function to be used in conjunction with a simulation. Visualizes the five best and five worst scenarios
-    for a given algorithm.
+    for a given algorithm. All ten scenarios are drawn onto one figure, which is rendered once when it is saved.
+
+    If an `image_writer` is given, the rendered pixels are handed to it for encoding and writing, and the pending write
+    is returned so that the caller can render its next figure in the meantime.
     """
     best_titles = ["Best", "2nd Best", "3rd Best", "4th Best", "5th Best"]
     worst_titles = ["Worst", "2nd Worst", "3rd Worst", "4th Worst", "5th Worst"]
 
-    fig, axes = plt.subplots(2, 5, figsize=(20, 10))
-    for index in range(5):
-        s, a = best[index]
-        efficiency = a.get_efficiency()
-        visualize_scenario(
-            scenario=s, 
-            title=best_titles[index] + f"\nScenario {s.get_nbr()}", 
-            assignment=a,
-            metric="efficiency",
-            metric_value=round(efficiency, 3),
-            ax=axes[0][index],
-            arc_rads_scale=arc_rads_scale
-        )
-        s, a = worst[index]
-        efficiency = a.get_efficiency()
-        visualize_scenario(
-            scenario=s, 
-            title=worst_titles[index] + f"\nScenario {s.get_nbr()}", 
-            assignment=a,
-            metric="efficiency",
-            metric_value=round(efficiency, 3),
-            ax=axes[1][index],
-            arc_rads_scale=arc_rads_scale
-        )
-    
-    visual_title = f"{algorithm_title} on {scenario_type}"
-    fig.suptitle(visual_title)
-    fig.tight_layout()
-
-    os.makedirs(output_dir, exist_ok=True)
-    save_path = os.path.join(output_dir, f"bw_{visual_title.replace(' ','')}.png")
-    plt.savefig(save_path)
-    plt.close()
-        
\ No newline at end of file
+    with plt.ioff():
+        fig, axes = plt.subplots(2, 5, figsize=(20, 10), dpi=dpi, constrained_layout=True)
+        for row, (ranked, titles) in enumerate([(best, best_titles), (worst, worst_titles)]):
+            for index in range(5):
+                s, a = ranked[index]
+                efficiency = a.get_efficiency()
+                visualize_scenario(
+                    scenario=s, 
+                    title=titles[index] + f"\nScenario {s.get_nbr()}", 
+                    assignment=a,
+                    metric="efficiency",
+                    metric_value=round(efficiency, 3),
+                    ax=axes[row][index],
+                    layout=_build_layout(s, arc_rads_scale)
+                )
+
+        visual_title = f"{algorithm_title} on {scenario_type}"
+        fig.suptitle(visual_title)
+
+        os.makedirs(output_dir, exist_ok=True)
+        save_path = os.path.join(output_dir, f"bw_{visual_title.replace(' ','')}.{image_format}")
+        if image_writer is None:
+            _save_figure(fig, save_path, dpi)
+            plt.close(fig)
+            return None
+
+        # Render with Agg whatever the pyplot backend is, as only Agg canvases hand out their pixels
+        canvas = FigureCanvasAgg(fig)
+        canvas.draw()
+        pixels = np.asarray(canvas.buffer_rgba()).copy()
+        plt.close(fig)
+        return image_writer.submit(_write_image, pixels, save_path, dpi)
+
+def visualize_best_worst_scenario_batch(jobs: list[dict[str, Any]]) -> None:
+    """
+    Calls `visualize_best_worst_scenarios(**job)` for every job, writing each figure to disk on a background thread while
+    the next one is rendered.
+    """
+    with ThreadPoolExecutor(max_workers=1) as image_writer:
+        writes = [visualize_best_worst_scenarios(**job, image_writer=image_writer) for job in jobs]
+        for write in writes:
+            write.result()